@@ -0,0 +1,89 @@
+### Async (ASGI) flavour of the read APIs, sharing the models, queries and serializers of app.py
+### Run with: uvicorn asgi:app --workers 4 (writes stay on the Flask app; both can run side by side)
+
+import os
+from contextlib import asynccontextmanager
+from flask import Config
+from sqlalchemy import event, make_url, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse as StarletteJSONResponse
+from starlette.routing import Route
+from app import Employee, Department, Dept_Locations, Project, Works_On, Dependent, dumpJSON, loadConfig, parseColumn, legacyDependentSerializer, reportQuery, reports, serialize, sqlitePragmas, versionTag
+
+class JSONResponse(StarletteJSONResponse): # Same encoder as the Flask app (orjson when installed, dates as YYYY-MM-DD)
+    def render(self, content):
+        return dumpJSON(content)
+
+config = loadConfig(Config(os.getcwd()))
+
+def asyncEngine(config): # Same DB_* pool settings as the Flask app, on asyncpg (or aiosqlite)
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    if url.get_backend_name() == 'postgresql':
+        url = url.set(drivername = 'postgresql+asyncpg')
+        if config['DB_PGBOUNCER']:
+            options.update(poolclass = NullPool, connect_args = {'statement_cache_size': 0}) # Prepared statements do not survive transaction pooling
+        else:
+            options.update(pool_size = config['DB_POOL_SIZE'], max_overflow = config['DB_MAX_OVERFLOW'], pool_timeout = config['DB_POOL_TIMEOUT'], pool_recycle = config['DB_POOL_RECYCLE'])
+            if config['DB_STATEMENT_TIMEOUT']:
+                options['connect_args'] = {'server_settings': {'statement_timeout': str(int(config['DB_STATEMENT_TIMEOUT']))}}
+    elif url.get_backend_name() == 'sqlite':
+        url = url.set(drivername = 'sqlite+aiosqlite') # 'sqlite://' (in memory) would be a database of its own here: use a file shared with the Flask app
+    engine = create_async_engine(url, **options)
+    if url.get_backend_name() == 'sqlite':
+        event.listen(engine.sync_engine, 'connect', sqlitePragmas(config['DB_SQLITE_PRAGMAS']))
+    return engine
+
+engine = asyncEngine(config)
+Session = async_sessionmaker(engine, expire_on_commit = False)
+
+lookups = { # Route -> table, response key, serializer, success message, not-found message, error message (as in the Flask get_* routes)
+    'get_employee': (Employee, "Employee", serialize, "Retrieved employee records!", "Employee not found.", "Error fetching employee."),
+    'get_department': (Department, "Department", serialize, "Retrieved department records!", "Department not found.", "Error fetching department."),
+    'get_dept_location': (Dept_Locations, "Department Location", serialize, "Retrieved department location's records!", "Department location not found.", "Error fetching department location."),
+    'get_project': (Project, "Project", serialize, "Retrieved project records!", "Project not found.", "Error fetching project."),
+    'get_works_on': (Works_On, "Working On", serialize, "Retrieved 'working on' records!", "'Working on' record not found.", "Error fetching 'working on' record."),
+    'get_dependent': (Dependent, "Dependent", legacyDependentSerializer, "Retrieved dependent records!", "Dependent record not found.", "Error fetching dependent record.")
+}
+
+async def lookup(request):
+    model, title, serializer, found, missing, failed = lookups[request.url.path.strip('/')]
+    key = request.query_params.get('key')
+    value = request.query_params.get('value')
+
+    if not key or not value:
+        return JSONResponse({"Error": "Both key and value are required."}, 400)
+    elif key not in model.__table__.columns:
+        return JSONResponse({"Error": "Invalid key provided."}, 400)
+
+    try:
+        value = parseColumn(model, key, value)
+    except ValueError:
+        return JSONResponse({"Error": f"Invalid value for {key}."}, 400)
+
+    try:
+        async with Session() as session:
+            record = (await session.scalars(select(model).where(getattr(model, key) == value).limit(1))).first()
+        if record:
+            return JSONResponse({"Message": found, title: serializer(record)}, headers = {"ETag": versionTag(record)}) # As the Flask get_* routes: the If-Match of update_*/delete_*
+        return JSONResponse({"Error": missing}, 404)
+    except Exception as e:
+        return JSONResponse({"Message": failed, "Error": str(e)}, 500)
+
+async def report(request):
+    name = request.url.path.strip('/')
+    try:
+        async with Session() as session:
+            res = (await session.execute(reportQuery(name, config))).all()
+        return JSONResponse([reports[name]['row'](result) for result in res])
+    except Exception as e:
+        return JSONResponse({"Message": f"Error retrieving {name}.", "Error": str(e)}, 500)
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await engine.dispose()
+
+app = Starlette(routes = [Route(f'/{name}', lookup) for name in lookups] + [Route(f'/{name}', report) for name in reports], lifespan = lifespan)
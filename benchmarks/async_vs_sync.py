@@ -0,0 +1,73 @@
+### Compares the Flask (gunicorn) and ASGI (uvicorn) flavours under the same concurrent load.
+### Start both servers against the same database, e.g.
+###     gunicorn -c gunicorn.conf.py --bind :8000
+###     uvicorn asgi:app --port 8001 --workers 4
+### then: python -m benchmarks.async_vs_sync --concurrency 500 --requests 20000 --path "/get_employee?key=Ssn&value=123456789"
+
+import argparse
+import asyncio
+import json
+import time
+import httpx
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))] if values else None
+
+async def run(baseUrl, paths, concurrency, total):
+    latencies, errors = [], 0
+    queue = asyncio.Queue()
+    for number in range(total):
+        queue.put_nowait(paths[number % len(paths)])
+
+    async def worker(client):
+        nonlocal errors
+        while not queue.empty():
+            path = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 500:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections = concurrency, max_keepalive_connections = concurrency)
+    async with httpx.AsyncClient(base_url = baseUrl, limits = limits, timeout = 60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[worker(client) for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2)
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sync', default = 'http://localhost:8000', help = 'Base URL of the Flask app')
+    parser.add_argument('--async', dest = 'asyncUrl', default = 'http://localhost:8001', help = 'Base URL of the ASGI app')
+    parser.add_argument('--path', action = 'append', help = 'Route to request (repeatable); defaults to a lookup and a report')
+    parser.add_argument('--concurrency', type = int, default = 200)
+    parser.add_argument('--requests', type = int, default = 10000)
+    parser.add_argument('--output', help = 'Write the results to this JSON file')
+    args = parser.parse_args()
+
+    paths = args.path or ['/get_employee?key=Dno&value=1', '/dept_details']
+    results = {}
+    for name, baseUrl in [('sync', args.sync), ('async', args.asyncUrl)]:
+        results[name] = asyncio.run(run(baseUrl, paths, args.concurrency, args.requests))
+        print(f"{name:>5}: {json.dumps(results[name])}")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({"paths": paths, "concurrency": args.concurrency, "results": results}, file, indent = 2)
+
+if __name__ == '__main__':
+    main()
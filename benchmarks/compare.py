@@ -0,0 +1,43 @@
+### Compares two benchmark result files: python -m benchmarks.compare old.json new.json [--threshold 10]
+### Exits with status 1 when a route's p95 latency grew by more than the threshold (percent) or it issues more queries.
+
+import argparse
+import json
+
+def change(old, new):
+    if not old:
+        return None
+    return (new - old) / old * 100
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type = float, default = 10.0, help = 'Allowed p95 increase in percent')
+    args = parser.parse_args()
+
+    with open(args.old) as file:
+        old = json.load(file)
+    with open(args.new) as file:
+        new = json.load(file)
+
+    print(f"{old['meta']['commit']} -> {new['meta']['commit']} ({new['meta']['database']}, {new['meta']['employees']} employees)")
+    regressions = []
+    for route, result in new['routes'].items():
+        before = old['routes'].get(route)
+        if before is None:
+            print(f"{route:<42} new route, p95 {result['p95_ms']:.2f} ms")
+            continue
+        p95 = change(before['p95_ms'], result['p95_ms'])
+        moreQueries = before['queries_per_request'] is not None and result['queries_per_request'] is not None and result['queries_per_request'] > before['queries_per_request']
+        regressed = (p95 is not None and p95 > args.threshold) or moreQueries
+        if regressed:
+            regressions.append(route)
+        print(f"{route:<42} p50 {before['p50_ms']:>9.2f} -> {result['p50_ms']:>9.2f} ms  p95 {before['p95_ms']:>9.2f} -> {result['p95_ms']:>9.2f} ms ({p95:+.1f}%)  queries {before['queries_per_request']} -> {result['queries_per_request']}{'  REGRESSION' if regressed else ''}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+### Deterministic synthetic 'Company' dataset for the benchmarks.
+### python -m benchmarks.generate --employees 100000 [--seed 42] [--drop]   (uses DATABASE_URL, like the app)
+###
+### Rows are generated and written in chunks, so memory stays flat from 1k to 10M employees.
+### Shape: ~100 employees per department, one project per ~20 employees, 1-4 Works_On rows per employee,
+### 0-3 dependents, and supervisor trees of fan-out 8 inside each department rooted at its manager.
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from app import Employee, Department, Dept_Locations, Project, Works_On, Dependent, create_app, db
+
+firstNames = ['John', 'Franklin', 'Alicia', 'Jennifer', 'Ramesh', 'Joyce', 'Ahmad', 'James', 'Priya', 'Wei', 'Maria', 'Olu', 'Sofia', 'Kenji', 'Aditya', 'Fatima']
+lastNames = ['Smith', 'Wong', 'Zelaya', 'Wallace', 'Narayan', 'English', 'Jabbar', 'Borg', 'Sharma', 'Chen', 'Garcia', 'Adeyemi', 'Rossi', 'Tanaka', 'Pathak', 'Khan']
+streets = ['Fondren', 'Voss', 'Castle', 'Berry', 'Fire Oak', 'Rice', 'Dallas', 'Stone']
+cities = ['Houston', 'Bellaire', 'Sugarland', 'Stafford', 'Spring', 'Humble', 'Katy', 'Austin']
+relationships = ['Spouse', 'Son', 'Daughter']
+firstSsn = 100000000
+fanOut = 8
+
+def shape(employees):
+    departments = max(1, employees // 100)
+    projects = max(1, employees // 20)
+    return departments, projects
+
+def ssn(index): # index 0..employees-1
+    return firstSsn + index
+
+def supervisorIndex(index, departments): # Employees of department d are d, d + D, d + 2D, ...; member j reports to member (j - 1) // fanOut
+    member = index // departments
+    if member == 0:
+        return None
+    return ((member - 1) // fanOut) * departments + index % departments
+
+def randomDate(rng, start, end):
+    return start + timedelta(days = rng.randrange((end - start).days))
+
+def generateDepartments(rng, departments):
+    for number in range(1, departments + 1):
+        yield {'Dname': f'Department {number}', 'Dnumber': number, 'Mgr_ssn': None, 'Mgr_start_date': randomDate(rng, date(1990, 1, 1), date(2024, 1, 1))}
+
+def generateLocations(rng, departments):
+    for number in range(1, departments + 1):
+        for city in rng.sample(cities, rng.randint(1, 3)):
+            yield {'Dnumber': number, 'Dlocation': city}
+
+def generateEmployees(rng, employees, departments):
+    for index in range(employees):
+        supervisor = supervisorIndex(index, departments)
+        depth = 0 if supervisor is None else 1 + (index // departments - 1).bit_length() // 3
+        yield {
+            'Fname': rng.choice(firstNames),
+            'Lname': rng.choice(lastNames),
+            'Ssn': ssn(index),
+            'Bdate': randomDate(rng, date(1955, 1, 1), date(2003, 1, 1)),
+            'Address': f'{rng.randint(1, 9999)} {rng.choice(streets)}, {rng.choice(cities)} TX',
+            'Sex': rng.choice('MF'),
+            'Salary': max(15000, int(rng.gauss(90000 - 12000 * min(depth, 5), 12000))),
+            'Super_ssn': None if supervisor is None else ssn(supervisor),
+            'Dno': index % departments + 1
+        }
+
+def generateProjects(rng, projects, departments):
+    for number in range(1, projects + 1):
+        yield {'Pname': f'Project {number}', 'Pnumber': number, 'Plocation': rng.choice(cities), 'Dnum': (number - 1) % departments + 1}
+
+def generateWorksOn(rng, employees, projects):
+    for index in range(employees):
+        for project in rng.sample(range(1, projects + 1), min(projects, rng.choices([1, 2, 3, 4], weights = [40, 35, 15, 10])[0])):
+            yield {'Essn': ssn(index), 'Pno': project, 'Hours': rng.randint(5, 40)}
+
+def generateDependents(rng, employees):
+    for index in range(employees):
+        for number in range(rng.choices([0, 1, 2, 3], weights = [45, 25, 20, 10])[0]):
+            yield {'Essn': ssn(index), 'Dependent_name': f'{rng.choice(firstNames)} {number + 1}', 'Sex': rng.choice('MF'), 'Bdate': randomDate(rng, date(1980, 1, 1), date(2024, 1, 1)), 'Relationship': rng.choice(relationships)}
+
+def write(model, rows, chunkSize):
+    count, chunk = 0, []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunkSize:
+            db.session.execute(db.insert(model), chunk)
+            db.session.commit()
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(db.insert(model), chunk)
+        db.session.commit()
+        count += len(chunk)
+    return count
+
+def generate(employees, seed = 42, chunkSize = 5000, drop = False, log = print):
+    departments, projects = shape(employees)
+    rng = random.Random(seed)
+    if drop:
+        db.drop_all(bind_key = None) # Primary only; replicas follow through replication
+    db.create_all(bind_key = None)
+
+    db.session.info['changeFeed'] = False # Seed data is not a change for the feed's subscribers (this session only: other requests keep logging)
+    started = time.perf_counter()
+    try:
+        counts = {
+            'Department': write(Department, generateDepartments(rng, departments), chunkSize),
+            'Dept_Locations': write(Dept_Locations, generateLocations(rng, departments), chunkSize),
+            'Employee': write(Employee, generateEmployees(rng, employees, departments), chunkSize)
+        }
+        # Managers are the roots of each department's supervisor tree (member 0, i.e. index d - 1)
+        db.session.execute(db.update(Department).values(Mgr_ssn = Department.Dnumber - 1 + firstSsn))
+        db.session.commit()
+        counts['Project'] = write(Project, generateProjects(rng, projects, departments), chunkSize)
+        counts['Works_On'] = write(Works_On, generateWorksOn(rng, employees, projects), chunkSize)
+        counts['Dependent'] = write(Dependent, generateDependents(rng, employees), chunkSize)
+    finally:
+        db.session.rollback()
+        db.session.info.pop('changeFeed', None)
+    log(f"Generated {counts} in {time.perf_counter() - started:.1f}s (seed {seed}).")
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--employees', type = int, default = 10000, help = 'Scale, from 1000 to 10000000')
+    parser.add_argument('--seed', type = int, default = 42)
+    parser.add_argument('--chunk-size', type = int, default = 5000)
+    parser.add_argument('--drop', action = 'store_true', help = 'Drop and recreate all tables first')
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        generate(args.employees, args.seed, args.chunk_size, args.drop)
+
+if __name__ == '__main__':
+    main()
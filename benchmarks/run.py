@@ -0,0 +1,192 @@
+### Runs a scripted workload against every CRUD, collection, bulk and report route and stores the results as JSON.
+### python -m benchmarks.run [--employees 10000 --generate] [--iterations 200] [--concurrency 1] [--url http://host:8000] [--output file.json]
+###
+### By default the app runs in-process (Flask test client) against DATABASE_URL, which also lets the harness count the SQL
+### statements of every request. With --url the requests go over HTTP to a running server and query counts are not available.
+### Compare two runs with: python -m benchmarks.compare old.json new.json
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from sqlalchemy import event
+from app import create_app, db
+from benchmarks.generate import firstSsn, generate, shape
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))] if values else None
+
+class Workload: # Request factories for every route; keys created by the add_* steps are reused by the update/delete steps
+    def __init__(self, employees, seed):
+        self.employees = employees
+        self.departments, self.projects = shape(employees)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.nextKey = firstSsn + employees + 1000000
+        self.created = {'employee': [], 'department': [], 'project': []}
+
+    def newKey(self, kind):
+        with self.lock:
+            self.nextKey += 1
+            self.created[kind].append(self.nextKey)
+            return self.nextKey
+
+    def ssn(self):
+        return firstSsn + self.rng.randrange(self.employees)
+
+    def steps(self): # (route name, method, function(iteration) -> (path, json body))
+        rng = self.rng
+        key = lambda kind, iteration: self.created[kind][iteration % len(self.created[kind])]
+        return [
+            ('high_dept_salary', 'GET', lambda i: ('/high_dept_salary', None)),
+            ('dept_details', 'GET', lambda i: ('/dept_details', None)),
+            ('project_details', 'GET', lambda i: ('/project_details', None)),
+            ('projects_multiple_employees', 'GET', lambda i: ('/projects_multiple_employees', None)),
+            ('employee_manager_details', 'GET', lambda i: ('/employee_manager_details', None)),
+            ('employee_manager_details?format=ndjson', 'GET', lambda i: ('/employee_manager_details?format=ndjson', None)),
+
+            ('add_employee', 'POST', lambda i: ('/add_employee', {'Fname': 'Bench', 'Lname': 'Mark', 'Ssn': self.newKey('employee'), 'Bdate': '1990-01-01', 'Address': 'Bench St', 'Sex': 'F', 'Salary': 50000, 'Super_ssn': None, 'Dno': rng.randint(1, self.departments)})),
+            ('add_department', 'POST', lambda i: ('/add_department', {'Dname': 'Bench', 'Dnumber': self.newKey('department'), 'Mgr_ssn': self.ssn(), 'Mgr_start_date': '2020-01-01'})),
+            ('add_project', 'POST', lambda i: ('/add_project', {'Pname': 'Bench', 'Pnumber': self.newKey('project'), 'Plocation': 'Houston', 'Dnum': rng.randint(1, self.departments)})),
+            ('add_works_on', 'POST', lambda i: ('/add_works_on', {'Essn': key('employee', i), 'Pno': rng.randint(1, self.projects), 'Hours': 10})),
+            ('add_dependent', 'POST', lambda i: ('/add_dependent', {'Essn': key('employee', i), 'Dependent_name': 'Bench', 'Sex': 'M', 'Bdate': '2010-01-01', 'Relationship': 'Son'})),
+            ('add_dept_location', 'POST', lambda i: ('/add_dept_location', {'Dnumber': key('department', i), 'Dlocation': 'Houston'})),
+
+            ('get_employee', 'GET', lambda i: (f'/get_employee?key=Ssn&value={self.ssn()}', None)),
+            ('get_employee?key=Dno', 'GET', lambda i: (f'/get_employee?key=Dno&value={rng.randint(1, self.departments)}', None)),
+            ('get_department', 'GET', lambda i: (f'/get_department?key=Dnumber&value={rng.randint(1, self.departments)}', None)),
+            ('get_dept_location', 'GET', lambda i: (f'/get_dept_location?key=Dnumber&value={rng.randint(1, self.departments)}', None)),
+            ('get_project', 'GET', lambda i: (f'/get_project?key=Pnumber&value={rng.randint(1, self.projects)}', None)),
+            ('get_works_on', 'GET', lambda i: (f'/get_works_on?key=Pno&value={rng.randint(1, self.projects)}', None)),
+            ('get_dependent', 'GET', lambda i: (f'/get_dependent?key=Essn&value={self.ssn()}', None)),
+            ('employees?Dno', 'GET', lambda i: (f'/employees?Dno={rng.randint(1, self.departments)}&limit=100', None)),
+            ('employees?sort=-Salary', 'GET', lambda i: ('/employees?sort=-Salary&limit=100', None)),
+            ('works_on?Pno', 'GET', lambda i: (f'/works_on?Pno={rng.randint(1, self.projects)}', None)),
+            ('employees/multi', 'POST', lambda i: ('/employees/multi', [self.ssn() for _ in range(100)])),
+            ('search', 'GET', lambda i: (f'/search?q={rng.choice(["jo", "smith", "houston", "product"])}', None)),
+            ('employees/subordinates', 'GET', lambda i: (f'/employees/{self.ssn()}/subordinates', None)),
+            ('analytics/salaries', 'GET', lambda i: (f"/analytics/salaries?group_by={rng.choice(['Dno', 'Sex', 'Super_ssn'])}", None)),
+
+            ('update_employee', 'PUT', lambda i: (f"/update_employee/{key('employee', i)}", {'Salary': rng.randint(30000, 90000)})),
+            ('update_department', 'PUT', lambda i: (f"/update_department/{key('department', i)}", {'Dname': 'Bench 2'})),
+            ('update_project', 'PUT', lambda i: (f"/update_project/{key('project', i)}", {'Plocation': 'Austin'})),
+            ('update_works_on', 'PUT', lambda i: (f"/update_works_on?Essn={key('employee', i)}", {'Hours': 20})),
+            ('update_dependent', 'PUT', lambda i: (f"/update_dependent?Essn={key('employee', i)}", {'Relationship': 'Daughter'})),
+            ('update_dept_location', 'PUT', lambda i: (f"/update_dept_location?Dnumber={key('department', i)}", {'Dlocation': 'Austin'})),
+
+            ('employees/bulk', 'POST', lambda i: ('/employees/bulk', [{'Ssn': self.newKey('employee'), 'Fname': 'Bulk', 'Dno': rng.randint(1, self.departments), 'Salary': 40000} for _ in range(100)])),
+
+            ('delete_works_on', 'DELETE', lambda i: (f"/delete_works_on/?Essn={key('employee', i)}", None)),
+            ('delete_dependent', 'DELETE', lambda i: (f"/delete_dependent/?Essn={key('employee', i)}", None)),
+            ('delete_dept_location', 'DELETE', lambda i: (f"/delete_dept_location/?Dnumber={key('department', i)}", None)),
+            ('delete_project', 'DELETE', lambda i: (f"/delete_project/{key('project', i)}", None)),
+            ('delete_employee', 'DELETE', lambda i: (f"/delete_employee/{key('employee', i)}", None)),
+            ('delete_department', 'DELETE', lambda i: (f"/delete_department/{key('department', i)}", None))
+        ]
+
+queryCounter = threading.local()
+
+def countQueries(conn, cursor, statement, parameters, context, executemany):
+    queryCounter.count = getattr(queryCounter, 'count', 0) + 1
+
+def measure(send, method, step, iterations, concurrency):
+    def one(iteration):
+        path, body = step(iteration)
+        queryCounter.count = 0
+        started = time.perf_counter()
+        status = send(method, path, body)
+        return time.perf_counter() - started, status, queryCounter.count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers = concurrency) as pool:
+        results = list(pool.map(one, range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [result[0] for result in results]
+    return {
+        'requests': iterations,
+        'errors': sum(1 for result in results if result[1] >= 500),
+        'client_errors': sum(1 for result in results if 400 <= result[1] < 500),
+        'throughput_rps': round(iterations / elapsed, 1),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'queries_per_request': round(sum(result[2] for result in results) / iterations, 2)
+    }
+
+def gitCommit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--employees', type = int, default = 10000, help = 'Scale of the dataset (must match the generated data)')
+    parser.add_argument('--generate', action = 'store_true', help = 'Drop, recreate and fill the database before running')
+    parser.add_argument('--seed', type = int, default = 42)
+    parser.add_argument('--iterations', type = int, default = 200, help = 'Requests per route')
+    parser.add_argument('--warmup', type = int, default = 10, help = 'Unmeasured requests per read route')
+    parser.add_argument('--concurrency', type = int, default = 1)
+    parser.add_argument('--route', action = 'append', help = 'Only run these routes (repeatable)')
+    parser.add_argument('--cache', action = 'store_true', help = 'Keep the report cache on (by default the reports are measured on the database)')
+    parser.add_argument('--url', help = 'Send requests to a running server instead of the in-process app')
+    parser.add_argument('--output', help = 'JSON results file (default: benchmarks/results/<commit>-<time>.json)')
+    args = parser.parse_args()
+
+    app = create_app(None if args.cache else {'REPORT_CACHE_TTL': 0})
+    with app.app_context():
+        if args.generate:
+            generate(args.employees, args.seed, drop = True)
+        dialect = db.engine.dialect.name
+
+        if args.url:
+            import httpx
+            client = httpx.Client(base_url = args.url, timeout = 120)
+            send = lambda method, path, body: client.request(method, path, json = body).status_code
+        else:
+            event.listen(db.engine, 'before_cursor_execute', countQueries)
+            client = app.test_client()
+            send = lambda method, path, body: client.open(path, method = method, json = body).status_code
+
+        workload = Workload(args.employees, args.seed)
+        results = {}
+        for name, method, step in workload.steps():
+            if args.route and name not in args.route:
+                continue
+            if method == 'GET':
+                for iteration in range(args.warmup):
+                    send(method, *step(iteration))
+            results[name] = measure(send, method, step, args.iterations, args.concurrency)
+            queries = results[name]['queries_per_request'] if not args.url else None
+            results[name]['queries_per_request'] = queries
+            print(f"{name:<42} p50 {results[name]['p50_ms']:>9.2f} ms  p95 {results[name]['p95_ms']:>9.2f} ms  p99 {results[name]['p99_ms']:>9.2f} ms  {results[name]['throughput_rps']:>8.1f} req/s  queries {queries}  errors {results[name]['errors']}/{results[name]['client_errors']}")
+
+    output = {
+        'meta': {
+            'commit': gitCommit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'database': dialect,
+            'target': args.url or 'in-process',
+            'employees': args.employees,
+            'seed': args.seed,
+            'iterations': args.iterations,
+            'concurrency': args.concurrency
+        },
+        'routes': results
+    }
+    path = args.output or os.path.join('benchmarks', 'results', f"{output['meta']['commit'] or 'unknown'}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok = True)
+    with open(path, 'w') as file:
+        json.dump(output, file, indent = 2)
+    print(f"Results written to {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+### Rows/sec of the JSON encoding of employee rows: the hand-built dicts + Flask's default provider the routes used before,
+### against the precompiled serializers + orjson (and the stdlib fallback), in row and column layout. No database needed.
+### python -m benchmarks.serialization [--rows 100000] [--repeat 5]
+
+import argparse
+import random
+import time
+from datetime import date
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+import app as flaskApp
+from app import Employee, columnar, dumpJSON, serialize
+
+def legacyRow(employee): # What get_employee built by hand before the serializers
+    return {
+        "First Name": employee.Fname,
+        "Last Name": employee.Lname,
+        "SSN": employee.Ssn,
+        "Birthday": employee.Bdate.strftime('%Y-%m-%d'),
+        "Address": employee.Address,
+        "Sex": employee.Sex,
+        "Salary": employee.Salary,
+        "Super SSN": employee.Super_ssn,
+        "Department Number": employee.Dno
+    }
+
+def employees(count, seed):
+    rng = random.Random(seed)
+    return [Employee(f'First{number}', f'Last{number}', number, date(rng.randint(1950, 2000), rng.randint(1, 12), rng.randint(1, 28)), f'{number} Main St', rng.choice('MF'), rng.randrange(20000, 90000), None, rng.randint(1, 50)) for number in range(count)]
+
+def stdlibOnly(encode): # Runs an encoder with orjson switched off, as on an install without it
+    def run(records):
+        saved, flaskApp.orjson = flaskApp.orjson, None
+        try:
+            return encode(records)
+        finally:
+            flaskApp.orjson = saved
+    return run
+
+def measure(encode, records, repeat): # Best of `repeat` runs, in rows per second
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(records)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(records) / best
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Benchmark the JSON serialization of employee rows.')
+    parser.add_argument('--rows', type = int, default = 100000)
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--seed', type = int, default = 42)
+    args = parser.parse_args()
+
+    records = employees(args.rows, args.seed)
+    legacyProvider = DefaultJSONProvider(Flask(__name__))
+    rowsAfter = lambda records: dumpJSON({"Employees": [serialize(record) for record in records]})
+    columnsAfter = lambda records: dumpJSON({"Employees": columnar([serialize(record) for record in records])})
+    variants = [
+        ('before: hand-built dicts + Flask json', lambda records: legacyProvider.dumps({"Employees": [legacyRow(record) for record in records]})),
+        ('after: precompiled serializer + stdlib json', stdlibOnly(rowsAfter))
+    ]
+    if flaskApp.orjson:
+        variants += [('after: precompiled serializer + orjson', rowsAfter), ('after: columnar + orjson', columnsAfter)]
+    else:
+        variants += [('after: columnar + stdlib json', columnsAfter)]
+
+    baseline = None
+    for name, encode in variants:
+        rate = measure(encode, records, args.repeat)
+        baseline = baseline or rate
+        print(f"{name:<45} {rate:>12,.0f} rows/s  {rate / baseline:5.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+### Production server settings: gunicorn -c gunicorn.conf.py
+### Every value can be changed through the environment variables below.
+
+import multiprocessing
+import os
+
+wsgi_app = 'app:create_app()'
+bind = os.environ.get('BIND', f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+# Processes x threads = concurrent requests. Each worker has its own connection pool
+# (DB_POOL_SIZE + DB_MAX_OVERFLOW, see app.py), so keep workers * (pool size + overflow)
+# below Postgres' max_connections, or set FLASK_DB_PGBOUNCER=true behind PgBouncer.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then so a slow leak cannot grow forever
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+# Workers build their own app (and engine) after the fork, so no connection is shared between processes
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
@@ -0,0 +1,41 @@
+### Fixtures: a fresh in-memory SQLite app (SQLite mode) per test, seeded with the benchmark dataset
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # The app module lives at the repository root
+
+import app as company
+
+seedEmployees = 300 # 3 departments, 15 projects, 600 Works_On rows
+firstSsn = 100000000
+
+@pytest.fixture
+def app():
+    flaskApp = company.create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://', # One shared in-memory connection: schema and migrations are applied at startup
+        'DB_SEED_EMPLOYEES': seedEmployees,
+        'REPORT_CACHE_TTL': 0 # The cache is module state shared by every app of the test run
+    })
+    with flaskApp.app_context():
+        yield flaskApp
+        company.db.session.remove()
+    with flaskApp.app_context():
+        company.db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def verifyStats(app): # Runs flask verify-stats and fails the test on any difference
+    def verify():
+        result = app.test_cli_runner().invoke(args = ['verify-stats'])
+        assert result.exit_code == 0, result.output
+        assert "match the base tables" in result.output
+    return verify
+
+def newEmployee(ssn, **values):
+    return dict({"Fname": "Test", "Lname": "Employee", "Ssn": ssn, "Bdate": "1990-01-01", "Address": None, "Sex": "F", "Salary": 50000, "Super_ssn": None, "Dno": 1}, **values)
@@ -0,0 +1,67 @@
+### GET /analytics/salaries against the same statistics computed here from the rows
+
+import pytest
+
+from conftest import company
+
+def percentile(values, fraction): # percentile_cont: linear interpolation between the closest ranks
+    values = sorted(values)
+    position = fraction * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def employees():
+    return company.db.session.scalars(company.db.select(company.Employee)).all()
+
+def analytics(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.json
+    return response.json
+
+@pytest.mark.parametrize('group', ['Dno', 'Sex'])
+def test_groups_match_the_rows(client, group):
+    body = analytics(client, f'/analytics/salaries?group_by={group}&percentiles=10,50,90&buckets=7')
+    rows = employees()
+    assert {entry[group] for entry in body['Groups']} == {getattr(row, group) for row in rows}
+    assert len(body['Bucket Edges']) == 8
+    for entry in body['Groups']:
+        members = [row for row in rows if getattr(row, group) == entry[group]]
+        salaries = [row.Salary for row in members if row.Salary is not None]
+        assert (entry['Employees'], entry['Salaried']) == (len(members), len(salaries))
+        assert (entry['Minimum'], entry['Maximum']) == (min(salaries), max(salaries))
+        assert entry['Average'] == pytest.approx(sum(salaries) / len(salaries), abs = 0.01)
+        for point in [10, 50, 90]:
+            assert entry['Percentiles'][f'p{point}'] == pytest.approx(percentile(salaries, point / 100), abs = 0.01)
+        assert sum(entry['Histogram']) == len(salaries)
+
+def test_supervisor_ratios(client):
+    rows = {row.Ssn: row for row in employees()}
+    body = analytics(client, '/analytics/salaries?group_by=Super_ssn')
+    for entry in body['Groups']:
+        supervisor = rows.get(entry['Super_ssn'])
+        ratios = [supervisor.Salary / row.Salary for row in rows.values() if row.Super_ssn == entry['Super_ssn'] and row.Salary] if supervisor and supervisor.Salary is not None else []
+        if not ratios:
+            assert entry['Supervisor Ratio'] is None
+            continue
+        assert entry['Supervisor Ratio']['Reports'] == len(ratios)
+        assert entry['Supervisor Ratio']['Average'] == pytest.approx(sum(ratios) / len(ratios), abs = 0.0001)
+        assert entry['Supervisor Ratio']['Median'] == pytest.approx(percentile(ratios, 0.5), abs = 0.0001)
+
+def test_threshold_and_filters(client):
+    assert len(analytics(client, '/analytics/salaries?threshold=30000')['Groups']) == len(client.get('/high_dept_salary').json)
+    averages = sorted(entry['Average'] for entry in analytics(client, '/analytics/salaries?group_by=Super_ssn')['Groups'] if entry['Average'] is not None)
+    threshold = (averages[len(averages) // 2 - 1] + averages[len(averages) // 2]) / 2 # Between two groups, clear of the rounding of Average
+    body = analytics(client, f'/analytics/salaries?group_by=Super_ssn&threshold={threshold}')
+    assert sorted(entry['Average'] for entry in body['Groups']) == [average for average in averages if average > threshold]
+    body = analytics(client, '/analytics/salaries?Dno__in=1,2&Salary__gte=40000')
+    assert {entry['Dno'] for entry in body['Groups']} <= {1, 2}
+    assert all(entry['Minimum'] >= 40000 for entry in body['Groups'])
+    assert body['Bucket Edges'][0] >= 40000
+
+def test_bad_arguments(client):
+    assert client.get('/analytics/salaries?group_by=Salary').status_code == 400
+    assert client.get('/analytics/salaries?percentiles=150').status_code == 400
+    assert client.get('/analytics/salaries?buckets=0').status_code == 400
+    assert client.get('/analytics/salaries?threshold=lots').status_code == 400
+    assert client.get('/analytics/salaries?Nope=1').status_code == 400
@@ -0,0 +1,50 @@
+### asgi.py: the async lookups and reports answer like the Flask routes (on a SQLite file both apps share)
+
+import pytest
+
+from conftest import company, firstSsn, seedEmployees
+
+asgi = pytest.importorskip('asgi')
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.testclient import TestClient
+
+@pytest.fixture
+def shared(tmp_path, monkeypatch): # (Flask test client, Starlette test client) on the same database
+    config = dict(company.defaultConfig, SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "company.db"}', DB_SEED_EMPLOYEES = seedEmployees)
+    flaskApp = company.create_app(config)
+    engine = asgi.asyncEngine(config)
+    monkeypatch.setattr(asgi, 'engine', engine) # Disposed by the app's lifespan
+    monkeypatch.setattr(asgi, 'Session', async_sessionmaker(engine, expire_on_commit = False))
+    with TestClient(asgi.app) as client:
+        yield flaskApp.test_client(), client
+    with flaskApp.app_context():
+        company.db.engine.dispose()
+
+def test_lookup_matches_flask_with_its_etag(shared):
+    flask, starlette = shared
+    for route, key in [('get_employee', 'Ssn'), ('get_department', 'Dnumber')]:
+        value = firstSsn if key == 'Ssn' else 1
+        expected = flask.get(f'/{route}?key={key}&value={value}')
+        response = starlette.get(f'/{route}?key={key}&value={value}')
+        assert response.status_code == 200
+        assert response.json() == expected.json
+        assert response.headers['ETag'] == expected.headers['ETag']
+
+def test_lookup_etag_is_accepted_as_if_match(shared):
+    flask, starlette = shared
+    etag = starlette.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['ETag']
+    assert flask.put(f'/update_employee/{firstSsn}', json = {"Salary": 1}, headers = {'If-Match': etag}).status_code == 200
+    assert flask.put(f'/update_employee/{firstSsn}', json = {"Salary": 2}, headers = {'If-Match': etag}).status_code == 412
+    assert starlette.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['ETag'] != etag
+
+def test_lookup_errors(shared):
+    flask, starlette = shared
+    assert starlette.get('/get_employee?key=Ssn').status_code == 400
+    assert starlette.get('/get_employee?key=Nope&value=1').status_code == 400
+    assert starlette.get('/get_employee?key=Ssn&value=abc').status_code == 400
+    assert starlette.get('/get_employee?key=Ssn&value=1').status_code == 404
+
+def test_reports_match_flask(shared):
+    flask, starlette = shared
+    for name in company.reports:
+        assert starlette.get(f'/{name}').json() == flask.get(f'/{name}').json, name
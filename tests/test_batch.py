@@ -0,0 +1,88 @@
+### POST /batch in atomic and continue modes, and the If-Match (412) checks
+
+from conftest import company, firstSsn, newEmployee
+
+def salary(ssn):
+    company.db.session.expire_all()
+    return company.db.session.get(company.Employee, ssn).Salary
+
+def employeeExists(ssn):
+    company.db.session.expire_all()
+    return company.db.session.get(company.Employee, ssn) is not None
+
+def test_atomic_batch_applies_everything(client, verifyStats):
+    works = company.db.session.scalars(company.db.select(company.Works_On).limit(1)).one()
+    response = client.post('/batch', json = [
+        {"op": "create", "table": "employees", "data": newEmployee(1)},
+        {"op": "create", "table": "works_on", "data": {"Essn": 1, "Pno": 1, "Hours": 10}},
+        {"op": "update", "table": "employees", "key": firstSsn, "data": {"Salary": 12345}},
+        {"op": "delete", "table": "works_on", "key": [works.Essn, works.Pno]}
+    ])
+    assert response.status_code == 200, response.json
+    assert response.json['Applied'] == 4
+    assert [result['Key'] for result in response.json['Results']] == [1, [1, 1], firstSsn, [works.Essn, works.Pno]]
+    assert employeeExists(1) and salary(firstSsn) == 12345
+    verifyStats()
+
+def test_atomic_batch_rolls_back_on_a_failure(client, verifyStats):
+    before = salary(firstSsn)
+    response = client.post('/batch', json = [
+        {"op": "create", "table": "employees", "data": newEmployee(2)},
+        {"op": "update", "table": "employees", "key": firstSsn, "data": {"Salary": 1}},
+        {"op": "delete", "table": "employees", "key": 999}
+    ])
+    assert response.status_code == 400
+    assert response.json['Applied'] == 0
+    assert [result['Status'] for result in response.json['Results']] == ['created', 'updated', 'failed']
+    assert not employeeExists(2) and salary(firstSsn) == before
+    verifyStats()
+
+def test_atomic_batch_constraint_violation_is_a_conflict(client):
+    response = client.post('/batch', json = [
+        {"op": "create", "table": "employees", "data": newEmployee(3)},
+        {"op": "create", "table": "works_on", "data": {"Essn": 3, "Pno": 999, "Hours": 1}} # No project 999
+    ])
+    assert response.status_code == 409
+    assert not employeeExists(3)
+
+def test_continue_batch_keeps_the_operations_that_worked(client, verifyStats):
+    response = client.post('/batch?mode=continue', json = [
+        {"op": "create", "table": "employees", "data": newEmployee(4)},
+        {"op": "create", "table": "employees", "data": newEmployee(4)}, # Duplicate key
+        {"op": "create", "table": "works_on", "data": {"Essn": 4, "Pno": 999, "Hours": 1}},
+        {"op": "update", "table": "employees", "key": 4, "data": {"Salary": 77000}}
+    ])
+    assert response.status_code == 207
+    assert (response.json['Applied'], response.json['Failed']) == (2, 2)
+    assert [result['Status'] for result in response.json['Results']] == ['created', 'failed', 'failed', 'updated']
+    assert salary(4) == 77000
+    verifyStats()
+
+def test_batch_version_mismatch_is_a_failed_precondition(client):
+    client.put(f'/update_employee/{firstSsn}', json = {"Salary": 1000}) # Version 1 -> 2
+    stale = {"op": "update", "table": "employees", "key": firstSsn, "version": 1, "data": {"Salary": 2000}}
+    response = client.post('/batch', json = [stale])
+    assert response.status_code == 412
+    assert salary(firstSsn) == 1000
+    assert client.post('/batch?mode=continue', json = [stale]).status_code == 207
+    assert client.post('/batch', json = [dict(stale, version = 2)]).status_code == 200
+    assert salary(firstSsn) == 2000
+
+def test_if_match_rejects_a_stale_or_foreign_etag(client):
+    etag = client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['ETag']
+    other = client.get(f'/get_employee?key=Ssn&value={firstSsn + 1}').headers['ETag']
+    assert etag != other # Same version, different rows
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Salary": 1}, headers = {'If-Match': other}).status_code == 412
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Salary": 2}, headers = {'If-Match': etag}).status_code == 200
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Salary": 3}, headers = {'If-Match': etag}).status_code == 412
+    assert client.delete(f'/delete_employee/{firstSsn}', headers = {'If-Match': etag}).status_code == 412
+    assert salary(firstSsn) == 2
+
+def test_stale_if_match_wins_over_a_bad_body(client):
+    etag = client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['ETag']
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Salary": 5}).status_code == 200
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Bdate": "not a date"}, headers = {'If-Match': etag}).status_code == 412
+    etag = client.get('/get_department?key=Dnumber&value=1').headers['ETag']
+    assert client.put('/update_department/1', json = {"Mgr_start_date": "1990-01-01"}).status_code == 200
+    assert client.put('/update_department/1', json = {"Mgr_start_date": "31/12/1990"}, headers = {'If-Match': etag}).status_code == 412
+    assert salary(firstSsn) == 5
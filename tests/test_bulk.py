@@ -0,0 +1,23 @@
+### POST /<table>/bulk: batches, per-row errors, and the COPY encoding (COPY itself needs PostgreSQL)
+
+import csv
+import io
+from datetime import date
+
+from conftest import company, newEmployee
+
+def test_copy_line_keeps_null_apart_from_any_text():
+    line = company.copyLine(['\\N', None, '', 'a "quoted", text', 5, date(1990, 1, 2)])
+    assert line == '"\\N",,"","a ""quoted"", text","5","1990-01-02"\n'
+    assert next(csv.reader(io.StringIO(line))) == ['\\N', '', '', 'a "quoted", text', '5', '1990-01-02'] # Quoting is what PostgreSQL's NULL '' tells apart
+
+def test_bulk_insert_reports_the_rows_that_failed(client, verifyStats):
+    rows = [newEmployee(ssn, Lname = '\\N') for ssn in range(1, 21)] + [newEmployee(5), {"Ssn": "nope"}]
+    response = client.post('/employees/bulk?batch_size=7', json = rows)
+    assert response.json['Inserted'] == 20, response.json
+    assert [error['Row'] for error in response.json['Errors']] == [21, 22]
+    assert company.db.session.get(company.Employee, 3).Lname == '\\N'
+    verifyStats()
+
+def test_bulk_copy_needs_postgresql(client):
+    assert client.post('/employees/bulk?method=copy', json = [newEmployee(1)]).status_code == 400
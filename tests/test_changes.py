@@ -0,0 +1,97 @@
+### GET /changes (resumable long-poll) and /changes/stream (Server-Sent Events) over Change_Log
+
+import json
+import threading
+import time
+
+from conftest import firstSsn, newEmployee
+
+def latest(client):
+    response = client.get('/changes')
+    assert response.status_code == 200 and response.json['Changes'] == []
+    return response.json['Next']
+
+def changes(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.json
+    return response.json
+
+def test_writes_are_read_back_in_order(client):
+    start = latest(client)
+    client.post('/add_employee', json = newEmployee(1))
+    client.put('/update_employee/1', json = {"Salary": 61000})
+    client.put('/update_employee/1', json = {"Ssn": 2}) # A key change: delete of the old key, insert of the new one
+    client.delete('/delete_employee/2')
+    body = changes(client, f'/changes?after={start}')
+    assert [(change['Operation'], change['Key']) for change in body['Changes']] == [('insert', 1), ('update', 1), ('delete', 1), ('insert', 2), ('delete', 2)]
+    assert body['Changes'][1]['Data']['Salary'] == 61000 and body['Changes'][1]['Table'] == 'employees'
+    assert body['Changes'][-1]['Data'] is None
+    assert changes(client, f"/changes?after={body['Next']}")['Changes'] == []
+
+def test_pages_resume_from_next(client):
+    start = latest(client)
+    for ssn in range(1, 6):
+        client.post('/add_employee', json = newEmployee(ssn))
+    seen, after = [], start
+    while True:
+        body = changes(client, f'/changes?after={after}&limit=2')
+        if not body['Changes']:
+            break
+        seen += [change['Key'] for change in body['Changes']]
+        after = body['Next']
+    assert seen == [1, 2, 3, 4, 5]
+
+def test_tables_and_keys_filter_the_feed(client):
+    start = latest(client)
+    client.post('/add_employee', json = newEmployee(1))
+    client.post('/add_works_on', json = {"Essn": 1, "Pno": 2, "Hours": 4})
+    client.post('/add_works_on', json = {"Essn": 1, "Pno": 3, "Hours": 4})
+    client.patch('/works_on/bulk?Pno=9', json = {"Hours": 1}) # Logged as one refresh of the table
+    body = changes(client, f'/changes?after={start}&tables=works_on')
+    assert [change['Operation'] for change in body['Changes']] == ['insert', 'insert', 'refresh']
+    body = changes(client, f'/changes?after={start}&tables=works_on&keys=1:3')
+    assert [(change['Operation'], change['Key']) for change in body['Changes']] == [('insert', [1, 3]), ('refresh', None)] # A refresh concerns every key
+
+def test_long_poll_wakes_on_a_commit(app, client):
+    start = latest(client)
+    writer = threading.Timer(0.3, lambda: app.test_client().post('/add_employee', json = newEmployee(1)))
+    began = time.monotonic()
+    writer.start()
+    body = changes(client, f'/changes?after={start}&wait=10')
+    writer.join()
+    assert [change['Key'] for change in body['Changes']] == [1]
+    assert time.monotonic() - began < 5
+    began = time.monotonic()
+    assert changes(client, f"/changes?after={body['Next']}&wait=0.2")['Changes'] == []
+    assert time.monotonic() - began >= 0.2
+
+def events(response, count): # The first `count` change events of an SSE response, as (id, data)
+    found, buffer = [], ''
+    for chunk in response.response:
+        buffer += chunk.decode() if isinstance(chunk, bytes) else chunk
+        while '\n\n' in buffer:
+            event, buffer = buffer.split('\n\n', 1)
+            fields = dict(line.split(': ', 1) for line in event.split('\n') if ': ' in line and not line.startswith(':'))
+            if fields.get('event') == 'change':
+                found.append((int(fields['id']), json.loads(fields['data'])))
+        if len(found) >= count:
+            response.close()
+            return found
+
+def test_stream_sends_changes_and_resumes_from_last_event_id(client):
+    start = latest(client)
+    client.put(f'/update_employee/{firstSsn}', json = {"Salary": 1})
+    client.put(f'/update_employee/{firstSsn}', json = {"Salary": 2})
+    response = client.get(f'/changes/stream?after={start}&tables=employees', buffered = False)
+    assert response.mimetype == 'text/event-stream'
+    sent = events(response, 2)
+    assert [data['Data']['Salary'] for _, data in sent] == [1, 2]
+    response = client.get('/changes/stream?tables=employees', headers = {'Last-Event-ID': str(sent[0][0])}, buffered = False)
+    assert [seq for seq, _ in events(response, 1)] == [sent[1][0]]
+
+def test_bad_arguments(client):
+    assert client.get('/changes?after=x').status_code == 400
+    assert client.get('/changes?tables=nope').status_code == 400
+    assert client.get('/changes?keys=1').status_code == 400
+    assert client.get('/changes?wait=1000').status_code == 400
+    assert client.get('/changes/stream?tables=employees,works_on&keys=1').status_code == 400
@@ -0,0 +1,45 @@
+### GET /<table>: keyset pagination, filters and sorting
+
+from conftest import firstSsn, seedEmployees
+
+def pages(client, url):
+    rows, after = [], None
+    while True:
+        response = client.get(url + (f'&after={after}' if after else ''))
+        assert response.status_code == 200, response.json
+        rows.extend(response.json['Employees'])
+        after = response.json['Next']
+        if after is None:
+            return rows
+
+def test_pages_cover_every_row_once(client):
+    rows = pages(client, '/employees?limit=70')
+    assert [row['SSN'] for row in rows] == list(range(firstSsn, firstSsn + seedEmployees))
+
+def test_sorted_pages_keep_ties_and_nulls_in_order(client):
+    client.put(f'/update_employee/{firstSsn + 5}', json = {"Salary": None})
+    rows = pages(client, '/employees?limit=40&sort=-Salary')
+    assert len(rows) == seedEmployees
+    salaries = [row['Salary'] for row in rows]
+    assert salaries[-1] is None # NULLs last
+    assert salaries[:-1] == sorted(salaries[:-1], reverse = True)
+    assert len({row['SSN'] for row in rows}) == seedEmployees
+
+def test_filters_narrow_every_page(client):
+    rows = pages(client, '/employees?limit=25&Dno=2&Salary__gte=50000')
+    assert rows and all(row['Department Number'] == 2 and row['Salary'] >= 50000 for row in rows)
+    everyone = pages(client, '/employees?limit=1000')
+    assert len(rows) == sum(1 for row in everyone if row['Department Number'] == 2 and (row['Salary'] or 0) >= 50000)
+
+def test_bad_arguments(client):
+    assert client.get('/employees?limit=0').status_code == 400
+    assert client.get('/employees?after=nonsense').status_code == 400
+    assert client.get('/employees?sort=Nope').status_code == 400
+    assert client.get('/employees?Nope=1').status_code == 400
+
+def test_expanded_collections_are_capped(app, client):
+    app.config['EXPAND_MAX_ITEMS'] = 5
+    department = client.get('/get_department?key=Dnumber&value=1&expand=employees.department').json['Department']
+    assert len(department['Employees']) == 5
+    assert department['Employees Truncated'] is True
+    assert all(employee['Department']['Department Number'] == 1 for employee in department['Employees'])
@@ -0,0 +1,54 @@
+### Arrow IPC and Parquet exports of tables and reports (GET /<table>/export, ?format=arrow|parquet, flask export)
+
+import io
+
+import pytest
+
+from conftest import company, seedEmployees
+
+pyarrow = pytest.importorskip('pyarrow')
+import pyarrow.ipc
+import pyarrow.parquet
+
+def parquetTable(response):
+    assert response.status_code == 200, response.get_data(as_text = True)
+    return pyarrow.parquet.read_table(io.BytesIO(response.get_data()))
+
+def test_table_export_as_parquet(client):
+    table = parquetTable(client.get('/employees/export'))
+    assert table.num_rows == seedEmployees
+    assert 'Salary' in table.column_names
+
+def test_table_export_as_arrow_stream(client):
+    response = client.get('/departments/export?format=arrow')
+    assert response.status_code == 200
+    table = pyarrow.ipc.open_stream(io.BytesIO(response.get_data())).read_all()
+    assert sorted(table.column('Dnumber').to_pylist()) == [1, 2, 3]
+
+def test_columns_and_filters(client):
+    table = parquetTable(client.get('/employees/export?columns=Ssn,Salary&Dno=2&Salary__gte=50000'))
+    assert table.column_names == ['Ssn', 'Salary']
+    expected = company.db.session.scalar(company.db.select(company.db.func.count()).where(company.Employee.Dno == 2, company.Employee.Salary >= 50000))
+    assert table.num_rows == expected
+
+def test_report_export_matches_the_json_report(client):
+    rows = client.get('/project_details').json
+    table = parquetTable(client.get('/project_details?format=parquet'))
+    assert table.num_rows == len(rows)
+    assert sorted(table.column('Pname').to_pylist()) == sorted(row['Project Name'] for row in rows)
+
+def test_response_parameters_are_not_filters(client):
+    assert parquetTable(client.get('/project_details?format=parquet&layout=rows')).num_rows > 0
+    assert parquetTable(client.get('/employees/export?layout=columnar')).num_rows == seedEmployees
+
+def test_bad_export_arguments(client):
+    assert client.get('/employees/export?columns=Nope').status_code == 400
+    assert client.get('/employees/export?format=xlsx').status_code == 400
+    assert client.get('/employees/export?Nope=1').status_code == 400
+
+def test_export_command(app, tmp_path):
+    path = tmp_path / 'employees.parquet'
+    result = app.test_cli_runner().invoke(args = ['export', 'employees', str(path), '--columns', 'Ssn,Dno', '--where', 'Dno=1'])
+    assert result.exit_code == 0, result.output
+    table = pyarrow.parquet.read_table(path)
+    assert table.column_names == ['Ssn', 'Dno'] and set(table.column('Dno').to_pylist()) == {1}
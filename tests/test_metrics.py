@@ -0,0 +1,63 @@
+### Server-Timing, GET /metrics (Prometheus text), /slow_queries and the N+1 flag
+
+import re
+
+import pytest
+
+from conftest import company, firstSsn
+
+@pytest.fixture(autouse = True)
+def freshMetrics(monkeypatch): # The counters are per process: start each test from zero
+    monkeypatch.setattr(company, 'routeMetrics', {})
+    monkeypatch.setattr(company, 'slowQueries', company.deque(maxlen = 100))
+
+def samples(client): # {(metric name, frozenset of labels): value}
+    text = client.get('/metrics').get_data(as_text = True)
+    found = {}
+    for name, labels, value in re.findall(r'^(\w+)(?:\{(.*)\})? (\S+)$', text, re.MULTILINE):
+        found[name, frozenset(re.findall(r'(\w+)="([^"]*)"', labels))] = float(value)
+    return found
+
+def test_server_timing_parts(app, client):
+    header = client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['Server-Timing']
+    parts = dict(re.findall(r'(\w+)(;dur=[\d.]+(?:;desc="[^"]*")?)', header)) # desc may hold a comma
+    assert list(parts) == ['db', 'serialize', 'app', 'total']
+    assert 'desc="1 queries' in parts['db']
+    durations = {name: float(re.search(r'dur=([\d.]+)', part).group(1)) for name, part in parts.items()}
+    assert durations['total'] >= durations['db'] and durations['total'] > 0
+    app.config['SERVER_TIMING'] = False
+    assert 'Server-Timing' not in client.get('/employees?limit=1').headers
+
+def test_metrics_count_each_route(client):
+    for _ in range(3):
+        client.get('/employees?limit=5')
+    client.get('/employees?limit=0') # A 400 is not an error
+    found = samples(client)
+    route = {('route', 'api.list_records'), ('method', 'GET')}
+    assert found['api_requests_total', frozenset(route)] == 4
+    assert found['api_request_errors_total', frozenset(route)] == 0
+    assert found['api_queries_total', frozenset(route)] == 3
+    assert found['api_sql_seconds_total', frozenset(route)] > 0
+
+def test_duration_histogram_is_cumulative(client):
+    for _ in range(3):
+        client.get('/employees?limit=5')
+    found = samples(client)
+    route = {('route', 'api.list_records'), ('method', 'GET')}
+    buckets = [found['api_request_duration_seconds_bucket', frozenset(route | {('le', str(bound))})] for bound in company.durationBuckets]
+    assert buckets == sorted(buckets) and buckets[-1] <= 3
+    assert found['api_request_duration_seconds_bucket', frozenset(route | {('le', '+Inf')})] == 3
+    assert found['api_request_duration_seconds_count', frozenset(route)] == 3
+
+def test_slow_queries_are_listed(app, client):
+    app.config['SLOW_QUERY_MS'] = 0
+    client.get(f'/get_employee?key=Ssn&value={firstSsn}')
+    entries = client.get('/slow_queries').json['Slow Queries']
+    assert entries and entries[0]['route'] == 'api.get_employee'
+    assert samples(client)['api_slow_queries', frozenset()] >= 1
+
+def test_repeated_statements_are_flagged(app, client):
+    assert 'X-N-Plus-One' not in client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers
+    app.config['N_PLUS_ONE_THRESHOLD'] = 0 # Any statement run once is now "repeated"
+    assert 'repeated' in client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['X-N-Plus-One']
+    assert samples(client)['api_n_plus_one_total', frozenset({('route', 'api.get_employee'), ('method', 'GET')})] == 1
@@ -0,0 +1,37 @@
+### GET/POST /<table>/multi: many rows by primary key in one query, in request order
+
+from conftest import company, firstSsn
+
+def test_rows_come_back_in_request_order_with_nulls(client):
+    response = client.get(f'/employees/multi?keys={firstSsn + 2},1,{firstSsn},{firstSsn + 2}')
+    assert response.status_code == 200
+    rows = response.json['Employees']
+    assert [row and row['SSN'] for row in rows] == [firstSsn + 2, None, firstSsn, firstSsn + 2]
+    assert response.json['Missing'] == [1]
+
+def test_post_accepts_every_key_shape(client):
+    works = company.db.session.scalars(company.db.select(company.Works_On).order_by(company.Works_On.Essn, company.Works_On.Pno).limit(2)).all()
+    keys = [[row.Essn, row.Pno] for row in works]
+    for body in [keys, {"keys": keys}, [{"Essn": essn, "Pno": pno} for essn, pno in keys]]:
+        response = client.post('/works_on/multi', json = body)
+        assert response.status_code == 200, response.json
+        assert [[row['Employee SSN'], row['Project Number']] for row in response.json['Working On']] == keys
+    response = client.get(f'/works_on/multi?keys={keys[0][0]}:{keys[0][1]},1:1')
+    assert response.json['Missing'] == [[1, 1]]
+
+def test_text_keys_keep_their_colons(client):
+    assert client.post('/add_dept_location', json = {"Dnumber": 1, "Dlocation": "Suite 4: East"}).status_code in [200, 201]
+    rows = client.get('/dept_locations/multi?keys=1:Suite 4: East').json['Department Locations']
+    assert rows[0]['Department Location'] == "Suite 4: East"
+
+def test_expand_works_on_many_rows(client):
+    rows = client.get(f'/employees/multi?keys={firstSsn},{firstSsn + 1}&expand=department').json['Employees']
+    assert all(row['Department']['Department Number'] == row['Department Number'] for row in rows)
+
+def test_bad_keys(app, client):
+    assert client.get('/employees/multi').status_code == 400
+    assert client.get('/employees/multi?keys=abc').status_code == 400
+    assert client.get('/works_on/multi?keys=1').status_code == 400
+    assert client.post('/employees/multi', json = {"Ssn": 1}).status_code == 400
+    app.config['MULTI_GET_MAX_KEYS'] = 2
+    assert client.post('/employees/multi', json = [1, 2, 3]).status_code == 400
@@ -0,0 +1,47 @@
+### GET /employees/<ssn>/subordinates, /chain and /span over Super_ssn, including supervisor cycles
+
+import pytest
+
+from conftest import newEmployee
+
+@pytest.fixture
+def tree(client): # 1 -> (2 -> 4 -> 5), (3)
+    for ssn, boss in [(1, None), (2, 1), (3, 1), (4, 2), (5, 4)]:
+        assert client.post('/add_employee', json = newEmployee(ssn, Super_ssn = boss)).status_code in [200, 201]
+    return client
+
+def test_subordinates_nearest_levels_first(tree):
+    body = tree.get('/employees/1/subordinates').json
+    assert [(row['SSN'], row['Depth']) for row in body['Subordinates']] == [(2, 1), (3, 1), (4, 2), (5, 3)]
+    assert (body['Truncated'], body['Cycle Detected']) == (False, False)
+    body = tree.get('/employees/1/subordinates?max_depth=2').json
+    assert [row['SSN'] for row in body['Subordinates']] == [2, 3, 4]
+    assert body['Truncated'] is True
+    assert tree.get('/employees/3/subordinates').json['Subordinates'] == []
+
+def test_chain_goes_up_to_the_top(tree):
+    body = tree.get('/employees/5/chain').json
+    assert [(row['SSN'], row['Depth']) for row in body['Management Chain']] == [(4, 1), (2, 2), (1, 3)]
+    assert tree.get('/employees/5/chain?max_depth=1').json['Truncated'] is True
+
+def test_span_counts_each_level(tree):
+    body = tree.get('/employees/1/span').json
+    assert (body['Direct Reports'], body['Total Subordinates'], body['Depth']) == (2, 4, 3)
+    assert body['Employees per Level'] == {'1': 2, '2': 1, '3': 1}
+
+def test_cycles_are_cut_and_reported(tree):
+    assert tree.put('/update_employee/1', json = {"Super_ssn": 5}).status_code == 200 # 1 -> 2 -> 4 -> 5 -> 1
+    body = tree.get('/employees/1/subordinates').json
+    assert [row['SSN'] for row in body['Subordinates']] == [2, 3, 4, 5]
+    assert body['Cycle Detected'] is True and body['Truncated'] is False
+    body = tree.get('/employees/4/chain').json
+    assert [row['SSN'] for row in body['Management Chain']] == [2, 1, 5]
+    assert body['Cycle Detected'] is True
+    body = tree.get('/employees/2/span').json
+    assert (body['Total Subordinates'], body['Cycle Detected']) == (4, True) # 4, 5, 1 and 3; the cycle stops at 2
+
+def test_bad_arguments(tree):
+    assert tree.get('/employees/999/subordinates').status_code == 404
+    assert tree.get('/employees/999/span').status_code == 404
+    assert tree.get('/employees/1/chain?max_depth=0').status_code == 400
+    assert tree.get('/employees/1/span?max_depth=1000').status_code == 400
@@ -0,0 +1,79 @@
+### Read replicas: GET routing, the db_primary_until cookie, and report cache fills from a lagging replica
+
+import sqlite3
+
+import pytest
+
+from conftest import company, firstSsn, seedEmployees
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch): # Returns an app factory: primary.db, and replica.db as a copy of it that never catches up (a replica lagging forever)
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+    seeder = company.create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}', 'DB_SEED_EMPLOYEES': seedEmployees})
+    with seeder.app_context():
+        company.db.engine.dispose()
+    with sqlite3.connect(primary) as source, sqlite3.connect(replica) as target:
+        source.backup(target)
+    monkeypatch.setattr(company, 'replicaState', {})
+    monkeypatch.setattr(company, 'reportCache', company.MemoryCache(100)) # Set up front, so no Change_Log follower thread outlives the test
+    apps = []
+    def make(**config):
+        flaskApp = company.create_app(dict({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}', 'DB_REPLICA_URLS': [f'sqlite:///{replica}'], 'REPORT_CACHE_TTL': 60}, **config))
+        apps.append(flaskApp)
+        return flaskApp
+    yield make
+    for flaskApp in apps:
+        with flaskApp.app_context():
+            for engine in company.db.engines.values():
+                engine.dispose()
+
+def salary(client, ssn):
+    return client.get(f'/get_employee?key=Ssn&value={ssn}').json['Employee']['Salary']
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary(replicated):
+    client = replicated().test_client()
+    response = client.get('/employees?limit=5')
+    assert response.headers['X-Database'] == 'replica0'
+    assert 'db_primary_until' not in response.headers.get('Set-Cookie', '')
+    response = client.put(f'/update_employee/{firstSsn}', json = {"Salary": 12345})
+    assert response.status_code == 200
+    assert response.headers['X-Database'] == 'primary'
+    assert 'db_primary_until' in response.headers['Set-Cookie']
+    assert client.get('/replica_status').headers['X-Database'] == 'primary'
+
+def test_sticky_cookie_reads_your_writes(replicated):
+    flaskApp = replicated()
+    client = flaskApp.test_client()
+    before = salary(client, firstSsn)
+    assert client.put(f'/update_employee/{firstSsn}', json = {"Salary": before + 1}).status_code == 200
+    assert salary(client, firstSsn) == before + 1 # The cookie keeps this client on the primary
+    assert flaskApp.test_client().get(f'/get_employee?key=Ssn&value={firstSsn}').headers['X-Database'] == 'replica0'
+    assert salary(flaskApp.test_client(), firstSsn) == before # Everyone else still reads the lagging replica
+    client.set_cookie('db_primary_until', '0')
+    assert salary(client, firstSsn) == before
+
+def test_route_override_and_unhealthy_replica(replicated):
+    flaskApp = replicated(DB_ROUTE_OVERRIDES = {'api.list_records': 'primary'}, DB_REPLICA_MAX_LAG = -1)
+    client = flaskApp.test_client()
+    assert client.get('/employees?limit=5').headers['X-Database'] == 'primary'
+    assert client.get(f'/get_employee?key=Ssn&value={firstSsn}').headers['X-Database'] == 'primary' # No replica within the lag limit
+    assert client.get('/replica_status').json['Replicas']['replica0']['Healthy'] is False
+
+def test_lagging_replica_does_not_fill_the_fresh_cache_entry(replicated):
+    flaskApp = replicated()
+    writer, reader = flaskApp.test_client(), flaskApp.test_client()
+    before = reader.get('/dept_details').json
+    dno = reader.get(f'/get_employee?key=Ssn&value={firstSsn}').json['Employee']['Department Number']
+    assert writer.put(f'/update_employee/{firstSsn}', json = {"Dno": dno % 3 + 1}).status_code == 200 # Moves the employee to another department
+    stale = reader.get('/dept_details') # Invalidated, refilled from the replica that has not seen the write
+    assert stale.headers['X-Database'] == 'replica0' and stale.headers['X-Cache'] == 'MISS'
+    assert stale.json == before
+    fresh = writer.get('/dept_details') # On the primary: a newer Change_Log position, so not the replica's entry
+    assert fresh.headers['X-Database'] == 'primary' and fresh.headers['X-Cache'] == 'MISS'
+    assert fresh.json != before
+    assert reader.get('/dept_details').headers['X-Cache'] == 'HIT'
+
+def test_replica_results_are_not_cached_without_the_change_feed(replicated):
+    client = replicated(CHANGE_FEED = False).test_client()
+    assert client.get('/dept_details').headers['X-Cache'] == 'MISS'
+    assert client.get('/dept_details').headers['X-Cache'] == 'MISS'
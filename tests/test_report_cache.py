@@ -0,0 +1,67 @@
+### The report cache: hits, 304s, eviction by the commits that change a report's columns, TTL/LRU, and Change_Log following
+
+import time
+
+import pytest
+
+from conftest import company, firstSsn
+
+@pytest.fixture
+def cached(app, monkeypatch): # The conftest app runs with the cache off; turn it on with a fresh cache and counters
+    app.config['REPORT_CACHE_TTL'] = 60
+    monkeypatch.setattr(company, 'reportCache', company.MemoryCache(app.config['REPORT_CACHE_MAX_ENTRIES'])) # Set up front, so no Change_Log follower thread starts
+    monkeypatch.setattr(company, 'cacheStats', {'hits': 0, 'misses': 0, 'invalidations': 0})
+    return app.test_client()
+
+def fetch(client, name, **headers):
+    response = client.get(f'/{name}', headers = headers)
+    assert response.status_code in [200, 304], response.get_data(as_text = True)
+    return response
+
+def test_second_request_is_a_hit_and_revalidates_with_304(cached):
+    first = fetch(cached, 'dept_details')
+    second = fetch(cached, 'dept_details')
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_data() == first.get_data() and second.headers['ETag'] == first.headers['ETag']
+    revalidated = fetch(cached, 'dept_details', **{'If-None-Match': first.headers['ETag']})
+    assert revalidated.status_code == 304 and revalidated.headers['X-Cache'] == 'HIT'
+    assert fetch(cached, 'dept_details?layout=columnar').headers['X-Cache'] == 'MISS' # Each query string has its own entry
+    assert (cached.get('/cache_stats').json['Hits'], cached.get('/cache_stats').json['Misses']) == (2, 2)
+
+def test_a_commit_evicts_only_the_reports_reading_its_columns(cached):
+    for name in company.reports:
+        fetch(cached, name)
+    old = fetch(cached, 'employee_manager_details')
+    assert cached.put(f'/update_employee/{firstSsn}', json = {"Salary": 999999}).status_code == 200
+    assert {name: fetch(cached, name).headers['X-Cache'] for name in company.reports} == {
+        'high_dept_salary': 'MISS', 'dept_details': 'HIT', 'project_details': 'HIT', 'projects_multiple_employees': 'HIT', 'employee_manager_details': 'MISS'}
+    assert fetch(cached, 'employee_manager_details', **{'If-None-Match': old.headers['ETag']}).status_code == 200 # The salary is in its rows: the old copy is not current any more
+    assert cached.put(f'/update_employee/{firstSsn}', json = {"Address": "1 New Street"}).status_code == 200 # Read by no report
+    assert all(fetch(cached, name).headers['X-Cache'] == 'HIT' for name in company.reports)
+    assert cached.post('/add_works_on', json = {"Essn": firstSsn, "Pno": 15, "Hours": 3}).status_code in [200, 201]
+    assert [name for name in company.reports if fetch(cached, name).headers['X-Cache'] == 'MISS'] == ['project_details', 'projects_multiple_employees']
+
+def test_rolled_back_writes_evict_nothing(cached):
+    fetch(cached, 'high_dept_salary')
+    assert cached.put(f'/update_employee/{firstSsn}', json = {"Salary": 1, "Bdate": "not a date"}).status_code == 500
+    assert fetch(cached, 'high_dept_salary').headers['X-Cache'] == 'HIT'
+
+def test_entries_expire_and_are_bounded(app, cached, monkeypatch):
+    app.config['REPORT_CACHE_TTL'] = 0.2
+    fetch(cached, 'dept_details')
+    time.sleep(0.3)
+    assert fetch(cached, 'dept_details').headers['X-Cache'] == 'MISS'
+    monkeypatch.setattr(company, 'reportCache', company.MemoryCache(1))
+    fetch(cached, 'dept_details')
+    fetch(cached, 'project_details') # Evicts the least recently used entry
+    assert fetch(cached, 'dept_details').headers['X-Cache'] == 'MISS'
+
+def test_other_workers_commits_reach_the_cache_through_change_log(app, cached):
+    seq = company.followChanges(company.reportCache, None)
+    fetch(cached, 'project_details')
+    app.config['REPORT_CACHE_TTL'] = 0 # As in another worker: the commit does not touch this cache
+    assert cached.post('/add_works_on', json = {"Essn": firstSsn, "Pno": 15, "Hours": 3}).status_code in [200, 201]
+    app.config['REPORT_CACHE_TTL'] = 60
+    assert fetch(cached, 'project_details').headers['X-Cache'] == 'HIT' # Stale until the follower catches up
+    assert company.followChanges(company.reportCache, seq) > seq
+    assert fetch(cached, 'project_details').headers['X-Cache'] == 'MISS'
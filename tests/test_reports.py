@@ -0,0 +1,63 @@
+### The five reports: maintained aggregates vs scans, the NumPy snapshot vs SQL, and the response formats
+
+import pytest
+
+from conftest import company, firstSsn, newEmployee
+
+def writeSomething(client): # CRUD, bulk and batch writes touching every report
+    responses = [
+        client.post('/employees/bulk', json = [newEmployee(ssn, Salary = 20000 + ssn * 500, Dno = 1 + ssn % 3, Super_ssn = firstSsn) for ssn in range(1, 31)]),
+        client.post('/works_on/bulk', json = [{"Essn": ssn, "Pno": 1 + ssn % 15, "Hours": ssn % 4 or None} for ssn in range(1, 31)]),
+        client.put(f'/update_employee/{firstSsn + 3}', json = {"Dno": 1, "Salary": 99000}),
+        client.patch('/works_on/bulk?Pno=5', json = {"Hours": 6}),
+        client.delete('/works_on/bulk?Essn__lt=6'),
+        client.post('/batch', json = [{"op": "delete", "table": "employees", "key": 7}, {"op": "update", "table": "employees", "key": 8, "data": {"Dno": 2}}])
+    ]
+    assert all(response.status_code in [200, 201] for response in responses), [response.json for response in responses]
+
+def sqlRows(name, aggregate):
+    query = company.reports[name]['aggregate' if aggregate else 'query']()
+    return company.db.session.execute(query).all()
+
+@pytest.mark.parametrize('name', list(company.reports))
+def test_aggregates_answer_like_the_scans(client, name):
+    writeSomething(client)
+    assert company.rowDifferences(name, sqlRows(name, True), sqlRows(name, False)) == (0, 0)
+
+def test_report_counts_are_integers(client): # Sums of the stats columns, cast back from numeric on PostgreSQL
+    for name in ['high_dept_salary', 'dept_details', 'project_details', 'projects_multiple_employees']:
+        rows = client.get(f'/{name}').json
+        assert rows
+        counts = [value for row in rows for key, value in row.items() if key.startswith('Number of')]
+        assert counts and all(value is None or isinstance(value, int) for value in counts)
+
+def test_formats_carry_the_same_rows(client):
+    rows = client.get('/project_details').json
+    lines = client.get('/project_details?format=ndjson').get_data(as_text = True).splitlines()
+    assert len(lines) == len(rows)
+    csv = client.get('/project_details?format=csv').get_data(as_text = True).splitlines()
+    assert len(csv) == len(rows) + 1
+    columnar = client.get('/project_details?layout=columnar').json
+    assert len(columnar['Project Name']) == len(rows)
+
+def test_conditional_report_request(client):
+    response = client.get('/dept_details')
+    assert client.get('/dept_details', headers = {'If-None-Match': response.headers['ETag']}).status_code == 304
+
+def test_snapshot_matches_sql_after_replaying_changes(app, client):
+    pytest.importorskip('numpy')
+    snapshot = company.ReportSnapshot()
+    with company.snapshotConnection() as connection:
+        snapshot.catchUp(connection) # Loaded before the writes, so they reach it through Change_Log
+    writeSomething(client)
+    for name in company.reports:
+        seq, rows, expected = company.checkSnapshot(snapshot, name)
+        assert seq > 0
+        assert company.rowDifferences(name, rows, expected) == (0, 0), name
+
+def test_check_snapshot_command(app, client):
+    pytest.importorskip('numpy')
+    writeSomething(client)
+    result = app.test_cli_runner().invoke(args = ['check-snapshot'])
+    assert result.exit_code == 0, result.output
+    assert result.output.count('identical') == len(company.reports)
@@ -0,0 +1,39 @@
+### GET /search: typed, ranked hits across tables (the substring fallback outside PostgreSQL)
+
+from conftest import firstSsn, newEmployee
+
+def results(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.json
+    return response.json['Results']
+
+def test_every_word_must_match_across_name_and_address(client):
+    client.post('/add_employee', json = newEmployee(1, Fname = "Zelda", Lname = "Quokka", Address = "12 Wombat Lane, Austin TX"))
+    client.post('/add_employee', json = newEmployee(2, Fname = "Zelda", Lname = "Smith", Address = "9 Elm, Houston TX"))
+    hits = results(client, '/search?q=zelda wombat')
+    assert [(hit['Type'], hit['Record']['SSN']) for hit in hits] == [('employees', 1)]
+    assert {hit['Record']['SSN'] for hit in results(client, '/search?q=Zelda&types=employees')} == {1, 2}
+
+def test_hits_are_typed_and_ranked(client):
+    client.post('/add_project', json = {"Pname": "Quokka", "Pnumber": 500, "Plocation": "Austin", "Dnum": 1})
+    client.post('/add_project', json = {"Pname": "Quokka Migration Phase Two", "Pnumber": 501, "Plocation": "Austin", "Dnum": 1})
+    client.post('/add_employee', json = newEmployee(3, Fname = "Ann", Lname = "Quokka"))
+    hits = results(client, '/search?q=quokka')
+    assert {hit['Type'] for hit in hits} == {'employees', 'projects'}
+    scores = [hit['Score'] for hit in hits]
+    assert scores == sorted(scores, reverse = True)
+    assert hits[0]['Record']['Project Name'] == "Quokka" # The exact name ranks first
+    assert [hit['Type'] for hit in results(client, '/search?q=quokka&types=projects&limit=1')] == ['projects']
+
+def test_dependents_and_locations_are_searched(client):
+    hits = results(client, '/search?q=katy&types=dept_locations,dependents')
+    assert hits and all(hit['Type'] == 'dept_locations' for hit in hits)
+    client.post('/add_dependent', json = {"Essn": firstSsn, "Dependent_name": "Xanthippe", "Sex": "F", "Bdate": "2010-05-05", "Relationship": "Daughter"})
+    hits = results(client, '/search?q=xanthippe')
+    assert [(hit['Type'], hit['Record']['Name of Dependent']) for hit in hits] == [('dependents', "Xanthippe")]
+
+def test_bad_arguments(client):
+    assert client.get('/search').status_code == 400
+    assert client.get('/search?q=%20-%20').status_code == 400
+    assert client.get('/search?q=x&types=employees,nope').status_code == 400
+    assert client.get('/search?q=x&limit=0').status_code == 400
@@ -0,0 +1,43 @@
+### Department_Stats / Project_Stats stay exact through every write path (flask verify-stats)
+
+from conftest import company, firstSsn, newEmployee
+
+def test_seeded_stats_match(verifyStats):
+    verifyStats()
+
+def test_crud_routes_keep_stats_exact(client, verifyStats):
+    assert client.post('/add_employee', json = newEmployee(1, Salary = 90000, Dno = 2)).status_code in [200, 201]
+    assert client.post('/add_works_on', json = {"Essn": 1, "Pno": 3, "Hours": 12}).status_code in [200, 201]
+    verifyStats()
+    assert client.put(f'/update_employee/{firstSsn + 7}', json = {"Dno": 3, "Salary": 31000}).status_code == 200
+    assert client.put('/update_works_on?Essn=1', json = {"Pno": 4, "Hours": 40}).status_code == 200
+    verifyStats()
+    assert client.delete('/delete_works_on/?Essn=1').status_code == 200
+    assert client.delete('/delete_employee/1').status_code == 200
+    verifyStats()
+
+def test_moving_a_project_keeps_stats_exact(client, verifyStats):
+    assert client.post('/add_project', json = {"Pname": "New", "Pnumber": 500, "Plocation": "Austin", "Dnum": 1}).status_code in [200, 201]
+    assert client.post('/add_works_on', json = {"Essn": firstSsn, "Pno": 500, "Hours": 5}).status_code in [200, 201]
+    assert client.put('/update_project/500', json = {"Dnum": 2}).status_code == 200
+    verifyStats()
+
+def test_bulk_writes_keep_stats_exact(client, verifyStats):
+    response = client.post('/employees/bulk', json = [newEmployee(ssn, Salary = ssn * 1000, Dno = 1 + ssn % 3) for ssn in range(1, 51)])
+    assert response.status_code in [200, 201], response.json
+    response = client.post('/works_on/bulk', json = [{"Essn": ssn, "Pno": 1 + ssn % 15, "Hours": 2} for ssn in range(1, 51)])
+    assert response.status_code in [200, 201], response.json
+    verifyStats()
+    assert client.patch('/employees/bulk?Dno=1&Salary__lt=40000', json = {"Dno": 2}).status_code == 200
+    assert client.patch('/works_on/bulk?Pno=2', json = {"Hours": 7}).status_code == 200
+    verifyStats()
+    assert client.delete('/works_on/bulk?Essn__lt=26').status_code == 200
+    assert client.delete('/employees/bulk?Ssn__lt=26').status_code == 200
+    verifyStats()
+
+def test_failed_bulk_insert_leaves_stats_exact(client, verifyStats):
+    rows = [newEmployee(ssn) for ssn in range(1, 11)] + [newEmployee(firstSsn)] # The last one already exists
+    client.post('/employees/bulk?atomic=true', json = rows)
+    assert company.db.session.get(company.Employee, 1) is None
+    client.post('/employees/bulk', json = rows)
+    verifyStats()